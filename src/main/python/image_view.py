@@ -0,0 +1,313 @@
+# image_view.py
+# This file contains the view used to display the image and edit the document's corners
+
+from typing import List, Optional
+
+import numpy as np
+from PyQt5.QtCore import QPoint, QPointF, QRectF, QSize, Qt, pyqtSignal
+from PyQt5.QtGui import QBrush, QColor, QPainter, QPen, QPixmap, QPolygonF
+from PyQt5.QtWidgets import (
+    QFrame,
+    QGraphicsEllipseItem,
+    QGraphicsItem,
+    QGraphicsPolygonItem,
+    QGraphicsScene,
+    QGraphicsView,
+    QLabel,
+)
+
+from utils import convert_ndarray_to_QPixmap
+
+
+class ImageView(QGraphicsView):
+    """
+    Display an image and let the user drag the document's corners on top of it.
+
+    The image is scaled to the view size once and painted as the scene background,
+    which Qt caches, so it is only rescaled when the image or the view size changes.
+    The border and corner handles are vector items on top of it: moving a corner
+    only repaints the overlay, never the image itself.
+    """
+
+    # Emitted while a corner is placed or dragged: (corner index, x, y) in image coordinates
+    cornerMoved = pyqtSignal(int, float, float)
+    # Emitted when the user grabs a corner handle
+    cornerSelected = pyqtSignal(int)
+
+    border_color = QColor(0, 255, 0)
+    active_color = QColor(255, 64, 64)
+    border_width = 2  # in screen pixels
+    handle_radius = 7  # in screen pixels
+    grab_distance = 14  # in screen pixels
+
+    loupe_size = 160  # in screen pixels
+    loupe_zoom = 4
+    loupe_margin = 10
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self._pixmap = QPixmap()  # full resolution, used by the loupe
+        self._display_pixmap = QPixmap()  # scaled to the view size
+        self._image_size = QSize()
+        self._active_idx = 0
+        self._dragging = False
+
+        self.setScene(QGraphicsScene(self))
+
+        self.setFrameShape(QFrame.NoFrame)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setRenderHints(QPainter.Antialiasing | QPainter.SmoothPixmapTransform)
+        # Rescaled image is kept in a view-sized cache and only blitted on updates
+        self.setCacheMode(QGraphicsView.CacheBackground)
+        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+
+        self.createLoupe()
+        self.createOverlay()
+
+    def createOverlay(self):
+        """
+        Create the border polygon and the 4 corner handles
+        """
+        pen = QPen(self.border_color, self.border_width)
+        # Keep border width constant in screen pixels whatever the zoom is
+        pen.setCosmetic(True)
+
+        self.border_item = QGraphicsPolygonItem()
+        self.border_item.setPen(pen)
+        self.scene().addItem(self.border_item)
+
+        r = self.handle_radius
+        self.handle_items: List[QGraphicsEllipseItem] = []
+        for _ in range(4):
+            handle = QGraphicsEllipseItem(-r, -r, 2 * r, 2 * r)
+            handle.setPen(QPen(Qt.black, 1))
+            handle.setBrush(QBrush(self.border_color))
+            # Keep handles the same size on screen whatever the zoom is
+            handle.setFlag(QGraphicsItem.ItemIgnoresTransformations)
+            handle.setZValue(1)
+            self.scene().addItem(handle)
+            self.handle_items.append(handle)
+
+        self.setOverlayVisible(False)
+
+    def createLoupe(self):
+        """
+        Create the magnifier shown around the active corner while dragging it
+        """
+        self.loupe = QLabel(self.viewport())
+        self.loupe.setFixedSize(self.loupe_size, self.loupe_size)
+        self.loupe.hide()
+
+    def setImage(self, image_mat: Optional[np.ndarray]):
+        """
+        Replace the displayed image and zoom it to fit the view
+        """
+        if image_mat is None:
+            self.clearImage()
+            return
+
+        self._pixmap = convert_ndarray_to_QPixmap(image_mat)
+        self._image_size = self._pixmap.size()
+        self.scene().setSceneRect(QRectF(self._pixmap.rect()))
+        self.zoomToFit()
+        self.updateDisplayPixmap()
+
+    def clearImage(self):
+        """
+        Remove the displayed image and the corners overlay
+        """
+        self._pixmap = QPixmap()
+        self._display_pixmap = QPixmap()
+        self._image_size = QSize()
+        self.setOverlayVisible(False)
+        self.scene().setSceneRect(QRectF())
+        self.resetCachedContent()
+        self.viewport().update()
+
+    def zoomToFit(self):
+        """
+        Scale the view so that the whole image fits in it
+        """
+        if self._pixmap.isNull():
+            return
+        self.fitInView(self.scene().sceneRect(), Qt.KeepAspectRatio)
+
+    def updateDisplayPixmap(self):
+        """
+        Scale the image to the view size, averaging pixels to avoid aliasing
+        """
+        if self._pixmap.isNull():
+            return
+        self._display_pixmap = self._pixmap.scaled(
+            self.viewport().size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
+        )
+        self.resetCachedContent()
+
+    def setOverlayVisible(self, visible: bool):
+        """
+        Show or hide the border and corner handles
+        """
+        self.border_item.setVisible(visible)
+        for handle in self.handle_items:
+            handle.setVisible(visible)
+        if not visible:
+            self._dragging = False
+            self.loupe.hide()
+
+    def isOverlayVisible(self) -> bool:
+        return self.border_item.isVisible()
+
+    def setCorners(self, corners: np.ndarray):
+        """
+        Move the border and the corner handles to the given coordinates
+        """
+        points = [QPointF(float(x), float(y)) for x, y in corners]
+
+        self.border_item.setPolygon(QPolygonF(points))
+        for handle, point in zip(self.handle_items, points):
+            handle.setPos(point)
+
+    def setCorner(self, idx: int, x: float, y: float):
+        """
+        Move a single corner, only the affected items are repainted
+        """
+        self.handle_items[idx].setPos(x, y)
+
+        polygon = self.border_item.polygon()
+        polygon[idx] = QPointF(x, y)
+        self.border_item.setPolygon(polygon)
+
+    def setActiveCorner(self, idx: int):
+        """
+        Set the corner which is placed on click and highlight its handle
+        """
+        self._active_idx = idx
+        for i, handle in enumerate(self.handle_items):
+            color = self.active_color if i == idx else self.border_color
+            handle.setBrush(QBrush(color))
+
+    def drawBackground(self, painter: QPainter, rect: QRectF):
+        super().drawBackground(painter, rect)
+
+        if not self._display_pixmap.isNull():
+            painter.drawPixmap(
+                self.scene().sceneRect(),
+                self._display_pixmap,
+                QRectF(self._display_pixmap.rect()),
+            )
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.zoomToFit()
+        self.updateDisplayPixmap()
+
+    def mousePressEvent(self, event):
+        if not self.isOverlayVisible() or event.button() != Qt.LeftButton:
+            super().mousePressEvent(event)
+            return
+
+        grabbed_idx = self.handleAt(event.pos())
+        if grabbed_idx is not None:
+            # Grab an existing handle without moving it
+            self.setActiveCorner(grabbed_idx)
+            self.cornerSelected.emit(grabbed_idx)
+        else:
+            # Place the active corner where the user clicked
+            self.moveActiveCorner(event.pos())
+
+        self._dragging = True
+        self.updateLoupe()
+
+    def mouseDoubleClickEvent(self, event):
+        # The second click of a double click places the corner like any other click
+        if self.isOverlayVisible() and event.button() == Qt.LeftButton:
+            self.mousePressEvent(event)
+            return
+
+        super().mouseDoubleClickEvent(event)
+
+    def mouseMoveEvent(self, event):
+        if not self._dragging:
+            super().mouseMoveEvent(event)
+            return
+
+        self.moveActiveCorner(event.pos())
+        self.updateLoupe()
+
+    def mouseReleaseEvent(self, event):
+        if not self._dragging or event.button() != Qt.LeftButton:
+            super().mouseReleaseEvent(event)
+            return
+
+        self._dragging = False
+        self.loupe.hide()
+
+    def handleAt(self, pos: QPoint) -> Optional[int]:
+        """
+        Return index of the nearest corner handle within grab distance of pos
+        """
+        nearest_idx = None
+        nearest_dist = self.grab_distance
+        for i, handle in enumerate(self.handle_items):
+            delta = self.mapFromScene(handle.pos()) - pos
+            dist = (delta.x() ** 2 + delta.y() ** 2) ** 0.5
+            if dist <= nearest_dist:
+                nearest_idx = i
+                nearest_dist = dist
+        return nearest_idx
+
+    def moveActiveCorner(self, pos: QPoint):
+        """
+        Move the active corner under pos, kept inside the image
+        """
+        scene_pos = self.mapToScene(pos)
+        x = int(round(min(max(scene_pos.x(), 0), self._image_size.width())))
+        y = int(round(min(max(scene_pos.y(), 0), self._image_size.height())))
+
+        self.setCorner(self._active_idx, x, y)
+        self.cornerMoved.emit(self._active_idx, x, y)
+
+    def updateLoupe(self):
+        """
+        Magnify the full resolution image around the active corner
+        """
+        if self._pixmap.isNull():
+            return
+
+        center = self.handle_items[self._active_idx].pos()
+        size = self.loupe_size
+        zoom = self.loupe_zoom
+
+        loupe_pixmap = QPixmap(size, size)
+        loupe_pixmap.fill(Qt.black)
+
+        # Only the pixels landing inside the loupe are sampled from the source
+        painter = QPainter(loupe_pixmap)
+        painter.translate(size / 2, size / 2)
+        painter.scale(zoom, zoom)
+        painter.translate(-center)
+        painter.drawPixmap(0, 0, self._pixmap)
+        painter.resetTransform()
+
+        # Draw crosshair on the corner
+        painter.setPen(QPen(self.active_color, 1))
+        painter.drawLine(size // 2, 0, size // 2, size)
+        painter.drawLine(0, size // 2, size, size // 2)
+
+        # Draw border of the loupe
+        painter.setPen(QPen(self.border_color, 2))
+        painter.drawRect(1, 1, size - 2, size - 2)
+        painter.end()
+
+        self.loupe.setPixmap(loupe_pixmap)
+
+        # Keep the loupe in the top corner away from the dragged handle
+        margin = self.loupe_margin
+        handle_pos = self.mapFromScene(center)
+        if handle_pos.x() < size + 2 * margin and handle_pos.y() < size + 2 * margin:
+            self.loupe.move(self.viewport().width() - size - margin, margin)
+        else:
+            self.loupe.move(margin, margin)
+        self.loupe.show()
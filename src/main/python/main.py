@@ -6,8 +6,8 @@ from typing import Callable, List
 
 import cv2
 import numpy as np
-from PyQt5.QtCore import QPoint, QSize, Qt
-from PyQt5.QtGui import QIcon, QPixmap
+from PyQt5.QtCore import QSize, Qt
+from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import (
     QAction,
     QDesktopWidget,
@@ -17,7 +17,6 @@ from PyQt5.QtWidgets import (
     QMainWindow,
     QMessageBox,
     QPushButton,
-    QSizePolicy,
     QStatusBar,
     QToolBar,
     QVBoxLayout,
@@ -25,11 +24,10 @@ from PyQt5.QtWidgets import (
 )
 from fbs_runtime.application_context.PyQt5 import ApplicationContext
 
+from image_view import ImageView
 from utils import (
     auto_select_corners,
-    convert_ndarray_to_QPixmap,
     crop,
-    draw_border,
     flip_horizontal,
     flip_vertical,
     rotate_90_clockwise
@@ -100,7 +98,7 @@ class PhotoEditor(QMainWindow):
 
         self.zoom_act = QAction(QIcon("icons/zoom.svg"), "Zoom to fit", self)
         self.zoom_act.setStatusTip("Zoom image to fit the screen")
-        self.zoom_act.triggered.connect(self.showImage)
+        self.zoom_act.triggered.connect(self.zoomImageToFit)
         tool_bar.addAction(self.zoom_act)
 
         tool_bar.addSeparator()
@@ -183,12 +181,10 @@ class PhotoEditor(QMainWindow):
         """
         Set up instances of widgets for photo editor GUI
         """
-        self.image = QPixmap()
-
-        self.image_label = QLabel()
-        self.image_label.setAlignment(Qt.AlignBaseline)
-        self.image_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Ignored)
-        self.setCentralWidget(self.image_label)
+        self.image_view = ImageView()
+        self.image_view.cornerMoved.connect(self.selectCorner)
+        self.image_view.cornerSelected.connect(self.switchCorner)
+        self.setCentralWidget(self.image_view)
 
     def centerMainWindow(self):
         """
@@ -220,7 +216,6 @@ class PhotoEditor(QMainWindow):
             self.auto_select_btn.setEnabled(True)
             for i in range(4):
                 self.corner_buttons[i].setEnabled(True)
-            self.image_label.mousePressEvent = self.selectCorner
         else:
             # Change button title to edit
             self.switch_mode_btn.setText("Edit")
@@ -234,7 +229,6 @@ class PhotoEditor(QMainWindow):
             self.auto_select_btn.setEnabled(False)
             for i in range(4):
                 self.corner_buttons[i].setEnabled(False)
-            self.image_label.mousePressEvent = None
             # Enable features
             self.save_act.setEnabled(True)
 
@@ -242,44 +236,46 @@ class PhotoEditor(QMainWindow):
 
     def switchCornerFactory(self, value) -> Callable[[], None]:
         def switchCorner():
-            self.corner_idx = value
+            self.switchCorner(value)
 
         return switchCorner
 
+    def switchCorner(self, idx: int):
+        self.corner_idx = idx
+        self.image_view.setActiveCorner(idx)
+
     def autoSelectCorner(self):
         self.corners = auto_select_corners(self.image_mat)
-        self.showImage()
-
-    def selectCorner(self, event):
-        tmp_pos: QPoint = event.pos()
-
-        current_idx = self.corner_idx
 
-        original_x = int(round(tmp_pos.x() * self.scale_ratio))
-        original_y = int(round(tmp_pos.y() * self.scale_ratio))
+        # Only the overlay changes, no need to redraw the image
+        self.image_view.setCorners(self.corners)
+        for i in range(4):
+            self.corner_labels[i].setText(str(self.corners[i]))
 
+    def selectCorner(self, idx: int, x: float, y: float):
+        """
+        Called by the image view while a corner is placed or dragged.
+        The view already moved the overlay, so the image is not redrawn.
+        """
         # Set corner coordinates
-        self.corners[current_idx] = (original_x, original_y)
+        self.corners[idx] = (x, y)
 
         # Set text for current corner
-        self.corner_labels[current_idx].setText(str(self.corners[current_idx]))
-
-        # Update image
-        self.showImage()
+        self.corner_labels[idx].setText(str(self.corners[idx]))
 
     def initCornersPoint(self):
         h, w = self.image_mat.shape[:2]
         self.corners: np.ndarray = np.array(
             [[0, 0], [w, 0], [w, h], [0, h]], dtype=np.float32
         )
-        self.corner_idx: int = 0
+        self.switchCorner(0)
 
         for i in range(self.corners.shape[0]):
             self.corner_labels[i].setText(str(self.corners[i]))
 
     def openImage(self):
         """
-        Open an image file and display its contents in label widget.
+        Open an image file and display its contents in the image view.
         Display error message if image can't be opened.
         """
         image_path, _ = QFileDialog.getOpenFileName(
@@ -334,25 +330,16 @@ class PhotoEditor(QMainWindow):
             return
 
         if self.is_edit_mode:
-            display_img_mat = draw_border(self.image_mat, self.corners)
+            display_img_mat = self.image_mat
         else:
             self.final_mat = crop(self.image_mat, self.corners)
             display_img_mat = self.final_mat
 
-        # Convert image_matrix to QPixmap
-        self.image = convert_ndarray_to_QPixmap(display_img_mat)
-
-        # scale the image to display
-        self.image = self.image.scaled(
-            self.image_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
-
-        # get scale ratio
-        original_height: int = display_img_mat.shape[0]
-        self.scale_ratio: float = original_height / self.image.height()
-
-        # show the image on screen
-        self.image_label.setPixmap(self.image)
+        # show the image on screen, corners are drawn on top of it in edit mode
+        self.image_view.setImage(display_img_mat)
+        if self.is_edit_mode:
+            self.image_view.setCorners(self.corners)
+        self.image_view.setOverlayVisible(self.is_edit_mode)
 
         # Update corners
         for i in range(4):
@@ -360,15 +347,20 @@ class PhotoEditor(QMainWindow):
 
     def clearImage(self):
         """
-        Clears current image in QLabel widget
+        Clears current image in the image view
         """
-        self.image_label.clear()
-        self.image = QPixmap()  # reset pixmap so that isNull() = True
+        self.image_view.clearImage()
         self.image_mat = None
         self.final_mat = None
         self.corners = None
         self.corner_idx = None
 
+    def zoomImageToFit(self):
+        """
+        Zoom the displayed image to fit the window
+        """
+        self.image_view.zoomToFit()
+
     def resetImage(self):
         self.image_mat = self.original_image
         self.final_mat = self.original_image
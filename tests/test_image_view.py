@@ -0,0 +1,132 @@
+# test_image_view.py
+# Smoke tests for the image view and the corner editing in the main window
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "main", "python"))
+
+QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+from PyQt5.QtCore import QEvent, QPoint, QPointF, Qt  # noqa: E402
+from PyQt5.QtGui import QMouseEvent  # noqa: E402
+from PyQt5.QtTest import QTest  # noqa: E402
+
+from image_view import ImageView  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def view(app):
+    view = ImageView()
+    view.resize(400, 300)
+    view.show()
+    QTest.qWaitForWindowExposed(view)
+
+    image = np.zeros((600, 800, 3), dtype=np.uint8)
+    corners = np.array([[0, 0], [800, 0], [800, 600], [0, 600]], dtype=np.float32)
+    view.setImage(image)
+    view.setCorners(corners)
+    view.setOverlayVisible(True)
+    view.setActiveCorner(0)
+
+    yield view
+    view.close()
+
+
+def record_moves(view):
+    moves = []
+    view.cornerMoved.connect(lambda idx, x, y: moves.append((idx, x, y)))
+    return moves
+
+
+def view_pos(view, x, y) -> QPoint:
+    return view.mapFromScene(QPointF(x, y))
+
+
+def drag_to(view, pos: QPoint):
+    # QTest.mouseMove doesn't report the held button, send the event directly
+    event = QMouseEvent(
+        QEvent.MouseMove, QPointF(pos), Qt.NoButton, Qt.LeftButton, Qt.NoModifier
+    )
+    QtWidgets.QApplication.sendEvent(view.viewport(), event)
+
+
+def test_scene_method_is_not_shadowed(view):
+    assert callable(view.scene)
+    assert view.scene().sceneRect().width() == 800
+
+
+def test_display_pixmap_is_scaled_to_view(view):
+    size = view._display_pixmap.size()
+    assert size.width() <= view.viewport().width()
+    assert size.height() <= view.viewport().height()
+
+
+def test_press_move_release_drags_active_corner(view):
+    moves = record_moves(view)
+
+    QTest.mousePress(view.viewport(), Qt.LeftButton, pos=view_pos(view, 200, 200))
+    assert view.loupe.isVisible()
+    assert view.loupe.pixmap().size() == view.loupe.contentsRect().size()
+
+    drag_to(view, view_pos(view, 300, 250))
+    QTest.mouseRelease(view.viewport(), Qt.LeftButton, pos=view_pos(view, 300, 250))
+
+    assert not view.loupe.isVisible()
+    assert len(moves) >= 2
+    idx, x, y = moves[-1]
+    assert idx == 0
+    assert abs(x - 300) <= 3 and abs(y - 250) <= 3
+    assert view.handle_items[0].pos() == QPointF(x, y)
+
+
+def test_grabbing_handle_selects_it_without_moving(view):
+    selected = []
+    view.cornerSelected.connect(selected.append)
+    moves = record_moves(view)
+
+    QTest.mousePress(view.viewport(), Qt.LeftButton, pos=view_pos(view, 800, 600))
+    QTest.mouseRelease(view.viewport(), Qt.LeftButton, pos=view_pos(view, 800, 600))
+
+    assert selected == [2]
+    assert moves == []
+
+
+def test_double_click_places_corner_twice(view):
+    moves = record_moves(view)
+
+    first = view_pos(view, 200, 200)
+    second = view_pos(view, 400, 300)
+    QTest.mouseClick(view.viewport(), Qt.LeftButton, pos=first)
+    QTest.mouseDClick(view.viewport(), Qt.LeftButton, pos=second)
+
+    assert len(moves) == 2
+    _, x, y = moves[-1]
+    assert abs(x - 400) <= 3 and abs(y - 300) <= 3
+
+
+def test_corners_are_clamped_to_image(view):
+    moves = record_moves(view)
+
+    QTest.mousePress(view.viewport(), Qt.LeftButton, pos=view_pos(view, 200, 200))
+    drag_to(view, view_pos(view, -500, 5000))
+    QTest.mouseRelease(view.viewport(), Qt.LeftButton, pos=view_pos(view, -500, 5000))
+
+    assert moves[-1][1:] == (0, 600)
+
+
+def test_main_window_starts(app):
+    pytest.importorskip("fbs_runtime")
+    import main
+
+    window = main.PhotoEditor()
+    assert isinstance(window.image_view, ImageView)
+    window.close()